@@ -98,13 +98,20 @@ IMAGE_SETTINGS = {
     }
 }
 
+# Largest side sent for AI image analysis; the vision API downscales bigger images anyway
+IMAGE_ANALYSIS_MAX_DIMENSION = 2048
+
 # === Cache Configuration ===
 WEBSITE_ANALYSIS_TTL = 300  # 5 minutes
 IMAGE_EXTRACTION_TTL = 300  # 5 minutes
+GPT_EXTRACTION_TTL = 86400  # 24 hours; GPT results for unchanged page content
+IMAGE_ANALYSIS_CACHE_SIZE = 64  # Image analyses kept per caption generator
 
 # === Request Configuration ===
 REQUEST_TIMEOUT = 10
 MAX_RETRIES = 3
+MAX_PARALLEL_IMAGE_REQUESTS = 4  # Concurrent per-image caption generations
+WEBSITE_MAX_PAGE_BYTES = 512 * 1024  # Stop downloading a page for analysis after 512KB
 
 # === File Upload Limits ===
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
@@ -124,5 +131,5 @@ SESSION_KEYS = {
     "business": ["business_name", "business_type", "target_audience", "product_name"],
     "settings": ["openai_model", "selected_platform", "platform_char_limit", "include_cta"],
     "results": ["generated_captions", "processed_images", "website_analysis_results"],
-    "company": ["selected_company", "company_profiles"]
+    "company": ["selected_company"]
 }
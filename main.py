@@ -4,14 +4,14 @@ Social Post Generator - AI-Powered Social Media Content Creation
 """
 
 import os
-import uuid
+import secrets
 import streamlit as st
 import openai
 from dotenv import load_dotenv
 
 # --- SESSION ID INITIALIZATION (MUST BE FIRST) ---
 if 'session_id' not in st.session_state:
-    st.session_state['session_id'] = str(uuid.uuid4())
+    st.session_state['session_id'] = secrets.token_hex(8)
 
 # Load environment variables
 load_dotenv()
@@ -82,7 +82,6 @@ def start_over():
         'session_token',     # Keep session token
         'last_activity',     # Keep last activity timestamp
         'login_attempts',    # Keep login attempt counter
-        'company_profiles',  # Keep saved company data
         'company_image_presets',  # Keep company image settings
         'file_uploader_key_counter',  # Keep the counter for image uploader reset
         'ignore_uploaded_files'  # Keep the flag to ignore uploaded files
@@ -202,12 +201,7 @@ def _handle_company_section():
             session_manager = get_session_manager()
             
             # Find profile by name (since old system used names)
-            profiles = session_manager.company_manager.list_profiles()
-            target_profile = None
-            for profile in profiles:
-                if profile.name == selected_company:
-                    target_profile = profile
-                    break
+            target_profile = session_manager.company_manager.get_profile_by_name(selected_company)
             
             if target_profile:
                 if session_manager.load_company_to_session(target_profile.company_id):
@@ -5,9 +5,16 @@ Caption generation module for Social Post Generator
 
 import openai
 import streamlit as st
-from config.constants import OPENAI_MODELS
-from typing import Tuple, List, Optional
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
+from config.constants import (
+    OPENAI_MODELS, MAX_PARALLEL_IMAGE_REQUESTS, IMAGE_ANALYSIS_MAX_DIMENSION, IMAGE_ANALYSIS_CACHE_SIZE
+)
+from typing import Tuple, List, Optional, Dict, Any
 import base64
+import hashlib
+import threading
+from collections import OrderedDict
 import io
 from PIL import Image
 
@@ -16,8 +23,11 @@ class CaptionGenerator:
     
     def __init__(self, openai_client):
         self.client = openai_client
+        # (sha256 of image bytes, model) -> analysis; survives reruns with the instance
+        self._analysis_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
     
-    def analyze_image(self, image_file) -> Optional[str]:
+    def analyze_image(self, image_file, model: str = OPENAI_MODELS["standard"]) -> Optional[str]:
         """Analyze uploaded image to understand its content for caption generation."""
         try:
             # Handle Streamlit UploadedFile objects properly
@@ -31,32 +41,49 @@ class CaptionGenerator:
             if not image_bytes:
                 return None
             
+            cache_key = (hashlib.sha256(image_bytes).hexdigest(), model)
+            with self._analysis_cache_lock:
+                cached = self._analysis_cache.get(cache_key)
+                if cached is not None:
+                    self._analysis_cache.move_to_end(cache_key)
+                    return cached
+            
             # Use PIL to properly handle the image and convert to supported format
             from PIL import Image
             import io
             
             image_stream = io.BytesIO(image_bytes)
             pil_image = Image.open(image_stream)
+            max_size = (IMAGE_ANALYSIS_MAX_DIMENSION, IMAGE_ANALYSIS_MAX_DIMENSION)
             
-            # Convert to RGB if necessary (for transparency or other modes)
-            if pil_image.mode in ('RGBA', 'LA', 'P'):
-                rgb_image = Image.new('RGB', pil_image.size, (255, 255, 255))
-                if pil_image.mode == 'P':
-                    pil_image = pil_image.convert('RGBA')
-                rgb_image.paste(pil_image, mask=pil_image.split()[-1] if pil_image.mode in ('RGBA', 'LA') else None)
-                pil_image = rgb_image
-            
-            # Save as JPEG to ensure compatibility
-            output_buffer = io.BytesIO()
-            pil_image.save(output_buffer, format='JPEG', quality=85)
-            processed_image_bytes = output_buffer.getvalue()
+            if (pil_image.format == 'JPEG' and pil_image.mode in ('RGB', 'L')
+                    and max(pil_image.size) <= IMAGE_ANALYSIS_MAX_DIMENSION):
+                # Already a compatible JPEG; send the original bytes without re-encoding
+                processed_image_bytes = image_bytes
+            else:
+                # Decode JPEGs at a reduced DCT scale and shrink oversized images before encoding
+                pil_image.draft('RGB', max_size)
+                pil_image.thumbnail(max_size)
+                
+                # Convert to RGB if necessary (for transparency or other modes)
+                if pil_image.mode in ('RGBA', 'LA', 'P'):
+                    rgb_image = Image.new('RGB', pil_image.size, (255, 255, 255))
+                    if pil_image.mode == 'P':
+                        pil_image = pil_image.convert('RGBA')
+                    rgb_image.paste(pil_image, mask=pil_image.getchannel('A') if pil_image.mode in ('RGBA', 'LA') else None)
+                    pil_image = rgb_image
+                
+                # Save as JPEG to ensure compatibility
+                output_buffer = io.BytesIO()
+                pil_image.save(output_buffer, format='JPEG', quality=85)
+                processed_image_bytes = output_buffer.getvalue()
             
             # Convert to base64
             base64_image = base64.b64encode(processed_image_bytes).decode('utf-8')
             
-            # Analyze image with GPT-4o (Vision model)
+            # Analyze image with the selected vision-capable model
             response = self.client.chat.completions.create(
-                model="gpt-4o",
+                model=model,
                 messages=[
                     {
                         "role": "user",
@@ -74,11 +101,16 @@ class CaptionGenerator:
                         ]
                     }
                 ],
-                max_tokens=300,
+                max_tokens=200,
                 temperature=0.3
             )
             
-            return response.choices[0].message.content.strip()
+            analysis = response.choices[0].message.content.strip()
+            with self._analysis_cache_lock:
+                self._analysis_cache[cache_key] = analysis
+                if len(self._analysis_cache) > IMAGE_ANALYSIS_CACHE_SIZE:
+                    self._analysis_cache.popitem(last=False)
+            return analysis
             
         except Exception as e:
             st.error(f"Error analyzing image: {str(e)}")
@@ -216,6 +248,28 @@ def get_caption_generator(openai_client):
         st.session_state.caption_generator = CaptionGenerator(openai_client)
     return st.session_state.caption_generator
 
+def _generate_image_captions(caption_generator, image_file, params) -> Optional[Dict[str, Any]]:
+    """Analyze a single image and generate captions for it."""
+    image_analysis = caption_generator.analyze_image(image_file, model=params['model'])
+    if not image_analysis:
+        return None
+    
+    # Generate captions for this specific image
+    params_with_image = params.copy()
+    params_with_image['image_analysis'] = image_analysis
+    
+    success, captions, error_msg = caption_generator.generate_captions(**params_with_image)
+    if not success:
+        return None
+    
+    # Add image context to captions for display
+    return {
+        'image_name': image_file.name,
+        'image_file': image_file,
+        'captions': captions,
+        'image_analysis': image_analysis
+    }
+
 def trigger_caption_generation(st):
     """Trigger caption generation and update session state."""
     # Clear previous results
@@ -236,6 +290,14 @@ def trigger_caption_generation(st):
         'include_cta': st.session_state.get('include_cta', False)
     }
     
+    # Validate required parameters before any API calls are made
+    required_params = ['business_name', 'business_type']
+    missing_params = [p for p in required_params if not (params[p] or '').strip()]
+    
+    if missing_params:
+        st.error(f"Please fill in required fields: {', '.join(missing_params)}")
+        return False
+    
     # Check for uploaded images and analyze them
     uploaded_images = st.session_state.get('uploaded_images', [])
     all_captions = []
@@ -246,31 +308,28 @@ def trigger_caption_generation(st):
             openai_client = initialize_openai_client()
             caption_generator = get_caption_generator(openai_client)
             
+            def process_image(image_file):
+                """Process one image, returning (captions_data, error)."""
+                try:
+                    return _generate_image_captions(caption_generator, image_file, params), None
+                except Exception as img_error:
+                    return None, img_error
+            
             with st.spinner(f"Analyzing {len(uploaded_images)} image(s) and generating captions..."):
-                for i, image_file in enumerate(uploaded_images, 1):
-                    try:
-                        # Analyze current image
-                        image_analysis = caption_generator.analyze_image(image_file)
-                        
-                        if image_analysis:
-                            # Generate captions for this specific image
-                            params_with_image = params.copy()
-                            params_with_image['image_analysis'] = image_analysis
-                            
-                            success, captions, error_msg = caption_generator.generate_captions(**params_with_image)
-                            
-                            if success:
-                                # Add image context to captions for display
-                                image_captions = {
-                                    'image_name': image_file.name,
-                                    'image_file': image_file,
-                                    'captions': captions,
-                                    'image_analysis': image_analysis
-                                }
-                                all_captions.append(image_captions)
-                    
-                    except Exception as img_error:
+                # Images are independent API round-trips, so run them concurrently.
+                # Worker threads get the script context so st.error calls still render.
+                script_ctx = get_script_run_ctx()
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_PARALLEL_IMAGE_REQUESTS, len(uploaded_images)),
+                    initializer=lambda: add_script_run_ctx(ctx=script_ctx)
+                ) as executor:
+                    results = list(executor.map(process_image, uploaded_images))
+                
+                for i, (image_captions, img_error) in enumerate(results, 1):
+                    if img_error is not None:
                         st.error(f"Error processing image {i}: {str(img_error)}")
+                    elif image_captions:
+                        all_captions.append(image_captions)
                 
                 if all_captions:
                     st.session_state.generated_captions = all_captions
@@ -287,14 +346,6 @@ def trigger_caption_generation(st):
         # No images - generate standard captions
         params['image_analysis'] = None
     
-    # Validate required parameters
-    required_params = ['business_name', 'business_type']
-    missing_params = [p for p in required_params if not params[p].strip()]
-    
-    if missing_params:
-        st.error(f"Please fill in required fields: {', '.join(missing_params)}")
-        return False
-    
     # Generate captions
     try:
         from main import initialize_openai_client
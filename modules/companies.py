@@ -3,24 +3,57 @@
 Company profile management for Social Post Generator
 """
 import streamlit as st
+import os
 import uuid
-from typing import Dict, List, Optional, Any
+import atexit
+import bisect
+import threading
+from typing import Dict, List, Optional, Any, Tuple
 import json
+from dataclasses import dataclass, field
 from datetime import datetime
+from utils.file_ops import dumps_json, loads_json, write_bytes_atomic
 
+@dataclass(slots=True)
 class CompanyProfile:
     """Represents a company profile with business information."""
+    company_id: Optional[str] = None
+    name: str = ""
+    business_type: str = ""
+    target_audience: str = ""
+    product_name: str = ""  # Main Product/Service field
+    website_url: str = ""
+    description: str = ""
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    _storage_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
-    def __init__(self, company_id: str = None):
-        self.company_id = company_id or str(uuid.uuid4())
-        self.name = ""
-        self.business_type = ""
-        self.target_audience = ""
-        self.product_name = ""  # Main Product/Service field
-        self.website_url = ""
-        self.description = ""
-        self.created_at = None
-        self.updated_at = None
+    def __post_init__(self):
+        if not self.company_id:
+            self.company_id = str(uuid.uuid4())
+    
+    def __setattr__(self, key: str, value: Any):
+        """Set an attribute and invalidate the cached storage dictionary."""
+        # object.__setattr__ since zero-argument super() does not work in slotted dataclasses
+        object.__setattr__(self, key, value)
+        if key != '_storage_cache':
+            object.__setattr__(self, '_storage_cache', None)
+    
+    def to_storage_dict(self) -> Dict[str, Any]:
+        """Convert profile to the on-disk format, reusing the cached result if unchanged."""
+        if self._storage_cache is None:
+            self._storage_cache = {
+                'business_input': self.name,  # Keep for compatibility
+                'name': self.name,  # Add proper name field
+                'business_type': self.business_type,
+                'target_audience': self.target_audience,
+                'product_name': self.product_name,  # Include product_name field
+                'website_url': self.website_url,
+                'description': self.description,
+                'created_at': self.created_at,
+                'updated_at': self.updated_at
+            }
+        return self._storage_cache
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary."""
@@ -53,143 +86,234 @@ class CompanyProfile:
 class CompanyManager:
     """Manages company profiles with persistent file storage."""
     
+    # Delay before pending changes are written, so bursts of saves share one write
+    SAVE_DELAY_SECONDS = 0.25
+    
     def __init__(self, profiles_file: str = "company_profiles.json"):
         self.profiles_file = profiles_file
         self.profiles = {}
+        self._by_recency = []  # Sorted (timestamp, company_id) pairs, oldest first
+        self._name_index = None  # Lazily built name -> company_id lookup
+        self._mtime = None  # Modification time of the file when last loaded/saved
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._pending_data = None
+        self._flush_timer = None
+        atexit.register(self.flush)
         self.load_profiles()
     
+    def _get_file_mtime(self) -> Optional[float]:
+        """Get modification time of the profiles file, None if missing."""
+        try:
+            return os.path.getmtime(self.profiles_file)
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _recency_key(profile: CompanyProfile) -> Tuple[str, str]:
+        """Get the sort key used by the recency index."""
+        return (profile.updated_at or profile.created_at or '', profile.company_id)
+    
+    def _rebuild_recency_index(self):
+        """Rebuild the recency index from all loaded profiles."""
+        self._by_recency = sorted(self._recency_key(p) for p in self.profiles.values())
+    
+    def _remove_from_recency_index(self, profile: CompanyProfile):
+        """Remove a profile's entry from the recency index."""
+        key = self._recency_key(profile)
+        index = bisect.bisect_left(self._by_recency, key)
+        if index < len(self._by_recency) and self._by_recency[index] == key:
+            self._by_recency.pop(index)
+    
+    def _refresh_if_changed(self):
+        """Reload profiles only if the file was changed by another session."""
+        with self._lock:
+            # Unsaved local changes take precedence until they are flushed
+            if not self._dirty and self._get_file_mtime() != self._mtime:
+                self.load_profiles()
+    
     def load_profiles(self):
         """Load company profiles from JSON file."""
-        try:
-            with open(self.profiles_file, 'r', encoding='utf-8') as f:
-                profiles_data = json.load(f)
+        with self._lock:
+            # Keep IDs stable across reloads since they are not persisted
+            existing_ids = {profile.name: profile.company_id for profile in self.profiles.values()}
+            
+            try:
+                with open(self.profiles_file, 'rb') as f:
+                    profiles_data = loads_json(f.read())
                 
-            # Convert old format to new format if needed
-            for company_name, data in profiles_data.items():
-                if isinstance(data, dict):
-                    # Convert old format to new CompanyProfile format
-                    profile = CompanyProfile()
-                    profile.name = company_name
-                    profile.business_type = data.get('business_type', '')
-                    profile.target_audience = data.get('target_audience', '')
-                    profile.product_name = data.get('product_name', '')  # Load product_name field
-                    profile.website_url = data.get('website_url', '')
-                    profile.description = data.get('description', '')
-                    
-                    # Use existing timestamps if available, otherwise set current time
-                    profile.created_at = data.get('created_at', datetime.now().isoformat())
-                    profile.updated_at = data.get('updated_at', datetime.now().isoformat())
+                self.profiles = {}
+                self._mtime = self._get_file_mtime()
+                now_iso = datetime.now().isoformat()  # Shared default for missing timestamps
                     
-                    self.profiles[profile.company_id] = profile
-                    
-        except FileNotFoundError:
-            # Create empty profiles file if it doesn't exist
-            self.profiles = {}
-            self.save_profiles()
-        except json.JSONDecodeError:
-            # Handle corrupted JSON file
-            self.profiles = {}
+                # Convert old format to new format if needed
+                for company_name, data in profiles_data.items():
+                    if isinstance(data, dict):
+                        # Convert old format to new CompanyProfile format
+                        profile = CompanyProfile(existing_ids.get(company_name))
+                        profile.name = company_name
+                        profile.business_type = data.get('business_type', '')
+                        profile.target_audience = data.get('target_audience', '')
+                        profile.product_name = data.get('product_name', '')  # Load product_name field
+                        profile.website_url = data.get('website_url', '')
+                        profile.description = data.get('description', '')
+                        
+                        # Use existing timestamps if available, otherwise set current time
+                        profile.created_at = data.get('created_at', now_iso)
+                        profile.updated_at = data.get('updated_at', now_iso)
+                        
+                        self.profiles[profile.company_id] = profile
+                        
+            except FileNotFoundError:
+                # Create empty profiles file if it doesn't exist
+                self.profiles = {}
+                self.save_profiles()
+            except json.JSONDecodeError:
+                # Handle corrupted JSON file
+                self.profiles = {}
+                self._mtime = self._get_file_mtime()
+            
+            self._rebuild_recency_index()
+            self._name_index = None
     
     def save_profiles(self):
-        """Save company profiles to JSON file."""
-        try:
-            # Convert to format for storage
-            profiles_data = {}
-            for profile in self.profiles.values():
-                profiles_data[profile.name] = {
-                    'business_input': profile.name,  # Keep for compatibility
-                    'name': profile.name,  # Add proper name field
-                    'business_type': profile.business_type,
-                    'target_audience': profile.target_audience,
-                    'product_name': profile.product_name,  # Include product_name field
-                    'website_url': profile.website_url,
-                    'description': profile.description,
-                    'created_at': profile.created_at,
-                    'updated_at': profile.updated_at
+        """Save company profiles, deferring the file write briefly to batch changes."""
+        with self._lock:
+            self._name_index = None
+            try:
+                # Convert to format for storage (unchanged profiles reuse their cached dict)
+                profiles_data = {
+                    profile.name: profile.to_storage_dict()
+                    for profile in self.profiles.values()
                 }
-            
-            with open(self.profiles_file, 'w', encoding='utf-8') as f:
-                json.dump(profiles_data, f, indent=2, ensure_ascii=False)
                 
-            # Also save to session state for backward compatibility
-            if 'company_profiles' not in st.session_state:
-                st.session_state.company_profiles = {}
-            st.session_state.company_profiles.update(profiles_data)
+                self._pending_data = profiles_data
+                self._dirty = True
+                
+            except Exception as e:
+                print(f"Error saving profiles: {e}")
             
-        except Exception as e:
-            print(f"Error saving profiles: {e}")
+            # Restart the delay so consecutive saves are written together
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.SAVE_DELAY_SECONDS, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write pending profile changes to the JSON file immediately."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if not self._dirty:
+                return
+            
+            try:
+                write_bytes_atomic(self.profiles_file, dumps_json(self._pending_data))
+                self._mtime = self._get_file_mtime()
+                self._dirty = False
+                self._pending_data = None
+            except Exception as e:
+                print(f"Error saving profiles: {e}")
     
     def create_profile(self, name: str) -> CompanyProfile:
         """Create a new company profile."""
-        profile = CompanyProfile()
-        profile.name = name
-        profile.created_at = datetime.now().isoformat()
-        
-        self.profiles[profile.company_id] = profile
-        self.save_profiles()
-        return profile
+        with self._lock:
+            self._refresh_if_changed()
+            profile = CompanyProfile()
+            profile.name = name
+            profile.created_at = datetime.now().isoformat()
+            
+            self.profiles[profile.company_id] = profile
+            bisect.insort(self._by_recency, self._recency_key(profile))
+            self.save_profiles()
+            return profile
     
     def get_profile(self, company_id: str) -> Optional[CompanyProfile]:
         """Get a company profile by ID."""
-        return self.profiles.get(company_id)
+        with self._lock:
+            self._refresh_if_changed()
+            return self.profiles.get(company_id)
+    
+    def get_profile_by_name(self, name: str) -> Optional[CompanyProfile]:
+        """Get a company profile by its name."""
+        with self._lock:
+            self._refresh_if_changed()
+            if self._name_index is None:
+                self._name_index = {p.name: p.company_id for p in self.profiles.values()}
+            return self.profiles.get(self._name_index.get(name))
     
     def update_profile(self, company_id: str, data: Dict[str, Any]) -> bool:
         """Update a company profile."""
-        if company_id in self.profiles:
-            profile = self.profiles[company_id]
-            for key, value in data.items():
-                if hasattr(profile, key):
-                    setattr(profile, key, value)
-            profile.updated_at = datetime.now().isoformat()
-            self.save_profiles()
-            return True
-        return False
+        with self._lock:
+            self._refresh_if_changed()
+            if company_id in self.profiles:
+                profile = self.profiles[company_id]
+                self._remove_from_recency_index(profile)
+                for key, value in data.items():
+                    if hasattr(profile, key):
+                        setattr(profile, key, value)
+                profile.updated_at = datetime.now().isoformat()
+                bisect.insort(self._by_recency, self._recency_key(profile))
+                self.save_profiles()
+                return True
+            return False
     
     def delete_profile(self, company_id: str) -> bool:
         """Delete a company profile."""
-        if company_id in self.profiles:
-            del self.profiles[company_id]
-            self.save_profiles()
-            return True
-        return False
+        with self._lock:
+            self._refresh_if_changed()
+            if company_id in self.profiles:
+                self._remove_from_recency_index(self.profiles.pop(company_id))
+                self.save_profiles()
+                return True
+            return False
     
     def list_profiles(self) -> List[CompanyProfile]:
         """Get all company profiles."""
-        return list(self.profiles.values())
+        with self._lock:
+            self._refresh_if_changed()
+            return list(self.profiles.values())
     
     def clear_all_profiles(self) -> bool:
         """Clear all saved company profiles."""
-        try:
-            self.profiles.clear()
-            self.save_profiles()
-            return True
-        except Exception as e:
-            print(f"Error clearing profiles: {e}")
-            return False
+        with self._lock:
+            try:
+                self.profiles.clear()
+                self._by_recency.clear()
+                self.save_profiles()
+                return True
+            except Exception as e:
+                print(f"Error clearing profiles: {e}")
+                return False
     
     def get_recent_companies(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent companies in the format expected by main.py."""
-        profiles = self.list_profiles()
-        
-        # Sort by updated_at or created_at, most recent first
-        sorted_profiles = sorted(profiles, key=lambda p: p.updated_at or p.created_at or '', reverse=True)
-        
-        # Convert to the format expected by main.py
-        recent_companies = []
-        for profile in sorted_profiles[:limit]:
-            company_data = {
-                'name': profile.name,
-                'profile': {
-                    'business_input': profile.name,
-                    'business_type': profile.business_type,
-                    'target_audience': profile.target_audience,
-                    'website_url': profile.website_url,
-                    'description': profile.description
+        with self._lock:
+            self._refresh_if_changed()
+            
+            # Take the newest entries from the recency index, most recent first
+            newest = self._by_recency[-limit:] if limit > 0 else []
+            sorted_profiles = [self.profiles[company_id] for _, company_id in reversed(newest)]
+            
+            # Convert to the format expected by main.py
+            recent_companies = []
+            for profile in sorted_profiles:
+                company_data = {
+                    'name': profile.name,
+                    'profile': {
+                        'business_input': profile.name,
+                        'business_type': profile.business_type,
+                        'target_audience': profile.target_audience,
+                        'website_url': profile.website_url,
+                        'description': profile.description
+                    }
                 }
-            }
-            recent_companies.append(company_data)
-        
-        return recent_companies
+                recent_companies.append(company_data)
+            
+            return recent_companies
     
     def populate_from_website_analysis(self, analysis_results: Dict[str, Any]):
         """Populate session state from website analysis."""
@@ -199,23 +323,27 @@ class CompanyManager:
         business_info = analysis_results.get('business_info', {})
         
         # Map website analysis to session state
-        mapping = {
-            'business_name': business_info.get('company_name', ''),
-            'business_type': business_info.get('business_type', ''),
-            'target_audience': business_info.get('target_audience', ''),
-            'description': business_info.get('description', '')
-        }
-        
-        for key, value in mapping.items():
+        for key, value in (
+            ('business_name', business_info.get('company_name', '')),
+            ('business_type', business_info.get('business_type', '')),
+            ('target_audience', business_info.get('target_audience', '')),
+            ('description', business_info.get('description', ''))
+        ):
             if value and value.strip():
                 st.session_state[key] = value
 
 
+@st.cache_resource
+def _get_shared_company_manager() -> CompanyManager:
+    """Get the process-wide CompanyManager shared by all sessions."""
+    return CompanyManager()
+
+
 class SessionManager:
     """Manages session state and company data integration."""
     
     def __init__(self):
-        self.company_manager = CompanyManager()
+        self.company_manager = _get_shared_company_manager()
     
     def load_company_to_session(self, company_id: str) -> bool:
         """Load company profile data into session state."""
@@ -228,17 +356,18 @@ class SessionManager:
                 'company_description_input'
             ]
             for key in widget_keys_to_clear:
-                if key in st.session_state:
-                    del st.session_state[key]
+                st.session_state.pop(key, None)
             
             # Load profile data into session state
-            st.session_state['selected_company'] = company_id
-            st.session_state['business_name'] = profile.name
-            st.session_state['business_type'] = profile.business_type
-            st.session_state['target_audience'] = profile.target_audience
-            st.session_state['product_name'] = profile.product_name  # Load product_name field
-            st.session_state['website_url'] = profile.website_url
-            st.session_state['company_description'] = profile.description
+            st.session_state.update({
+                'selected_company': company_id,
+                'business_name': profile.name,
+                'business_type': profile.business_type,
+                'target_audience': profile.target_audience,
+                'product_name': profile.product_name,  # Load product_name field
+                'website_url': profile.website_url,
+                'company_description': profile.description
+            })
             return True
         return False
     
@@ -259,6 +388,11 @@ class SessionManager:
             'description': st.session_state.get('company_description', '')
         }
         
+        # Skip the write when the stored profile already matches the session
+        profile = self.company_manager.get_profile(company_id)
+        if profile and all(getattr(profile, key) == value for key, value in session_data.items()):
+            return True
+        
         return self.company_manager.update_profile(company_id, session_data)
     
     def populate_from_website_analysis(self, analysis_results: Dict[str, Any]):
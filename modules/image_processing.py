@@ -8,6 +8,8 @@ from typing import List, Optional, Tuple, Any
 from PIL import Image
 import streamlit as st
 
+PREVIEW_MAX_SIZE = (512, 512)
+
 class ImageUploader:
     """Simple class for handling image uploads for caption reference."""
     
@@ -15,60 +17,64 @@ class ImageUploader:
         self.max_file_size = 5 * 1024 * 1024  # 5MB
         self.allowed_formats = ["png", "jpg", "jpeg", "webp"]
     
-    def validate_uploaded_file(self, uploaded_file) -> Tuple[bool, str]:
+    def validate_uploaded_file(self, uploaded_file) -> Tuple[bool, str, Optional[Image.Image]]:
         """Validate a single uploaded file.
         
         Args:
             uploaded_file: Streamlit uploaded file object
             
         Returns:
-            Tuple of (is_valid, error_message)
+            Tuple of (is_valid, error_message, opened_image_or_None)
         """
         if uploaded_file is None:
-            return False, "No file uploaded"
+            return False, "No file uploaded", None
         
         # Check file size
         if uploaded_file.size > self.max_file_size:
             size_mb = uploaded_file.size / (1024 * 1024)
-            return False, f"File too large: {size_mb:.1f}MB (max 5MB)"
+            return False, f"File too large: {size_mb:.1f}MB (max 5MB)", None
         
         # Check file format
         file_extension = uploaded_file.name.split('.')[-1].lower()
         if file_extension not in self.allowed_formats:
-            return False, f"Unsupported format: {file_extension}. Use: {', '.join(self.allowed_formats)}"
+            return False, f"Unsupported format: {file_extension}. Use: {', '.join(self.allowed_formats)}", None
         
         try:
-            # Try to open as image
+            # Image.open only parses the header; pixel data is decoded lazily on use
             image = Image.open(uploaded_file)
-            image.verify()  # Verify it's a valid image
-            return True, ""
+            if not image.format or image.width <= 0 or image.height <= 0:
+                return False, "Invalid image file: unrecognized image data", None
+            return True, "", image
         except Exception as e:
-            return False, f"Invalid image file: {str(e)}"
+            return False, f"Invalid image file: {str(e)}", None
+        finally:
+            # Rewind so previews and caption generation can read the file again
+            uploaded_file.seek(0)
     
-    def process_uploaded_files(self, uploaded_files) -> Tuple[List[Any], List[str]]:
+    def process_uploaded_files(self, uploaded_files) -> Tuple[List[Tuple[Any, Image.Image]], List[str]]:
         """Process multiple uploaded files.
         
         Args:
             uploaded_files: List of Streamlit uploaded file objects
             
         Returns:
-            Tuple of (valid_files, error_messages)
+            Tuple of (valid (file, opened_image) pairs, error_messages)
         """
-        valid_files = []
+        valid_entries = []
         error_messages = []
         
         if not uploaded_files:
-            return valid_files, error_messages
+            return valid_entries, error_messages
         
         for uploaded_file in uploaded_files:
-            is_valid, error_msg = self.validate_uploaded_file(uploaded_file)
+            is_valid, error_msg, image = self.validate_uploaded_file(uploaded_file)
             
             if is_valid:
-                valid_files.append(uploaded_file)
+                valid_entries.append((uploaded_file, image))
             else:
                 error_messages.append(f"{uploaded_file.name}: {error_msg}")
         
-        return valid_files, error_messages
+        return valid_entries, error_messages
 
 # --- UI Section: Image Upload ---
 def show_image_upload_section():
@@ -97,7 +103,8 @@ def show_image_upload_section():
     
     if uploaded_files:
         uploader = ImageUploader()
-        valid_files, error_messages = uploader.process_uploaded_files(uploaded_files)
+        valid_entries, error_messages = uploader.process_uploaded_files(uploaded_files)
+        valid_files = [uploaded_file for uploaded_file, _ in valid_entries]
         
         # Show errors if any
         if error_messages:
@@ -116,10 +123,12 @@ def show_image_upload_section():
             
             # Show preview of uploaded images
             cols = st.columns(min(3, len(valid_files)))
-            for i, uploaded_file in enumerate(valid_files[:3]):  # Show max 3 previews
+            for i, (uploaded_file, image) in enumerate(valid_entries[:3]):  # Show max 3 previews
                 with cols[i]:
                     try:
-                        image = Image.open(uploaded_file)
+                        # Reuse the image opened during validation; downscale so
+                        # full-resolution data isn't sent to the browser
+                        image.thumbnail(PREVIEW_MAX_SIZE)
                         st.image(image, caption=uploaded_file.name, use_container_width=True)
                     except Exception as e:
                         st.error(f"Can't preview {uploaded_file.name}")
@@ -5,32 +5,46 @@ Clean, business-focused interface components
 """
 
 import streamlit as st
-import uuid
 from typing import Dict, Any, Tuple
+from config.constants import OPENAI_MODELS
+
+# Platform/length options and their character limits (None = no hard limit)
+PLATFORM_LIMITS = {
+    "4-5 sentences (Default)": None,
+    "2-3 sentences": None,
+    "3-4 sentences": None,
+    "All Social Platforms": None,
+    "Twitter/X": 280,
+    "Instagram": 2200,
+    "LinkedIn": 3000,
+    "Facebook": None
+}
+PLATFORM_OPTIONS = tuple(PLATFORM_LIMITS)
+
+# Model selector labels mapped to OpenAI model names
+AI_MODEL_OPTIONS = {
+    "GPT-4o-mini (Recommended)": OPENAI_MODELS["standard"],
+    "GPT-4o (Premium)": OPENAI_MODELS["premium"]
+}
+AI_MODEL_LABELS = tuple(AI_MODEL_OPTIONS)
+
+# Character count styling indexed by severity: 0 = within, 1 = near (>90%), 2 = over limit
+CHAR_COUNT_COLORS = ("#00aa00", "#ff8800", "#ff4444")  # Green, orange, red
+CHAR_COUNT_SUFFIXES = ("", " (near limit)", " (over limit)")
 
 class UIComponents:
     """Core UI components for the Social Post Generator."""
     
     def __init__(self):
-        self.platform_limits = {
-            "4-5 sentences (Default)": None,
-            "2-3 sentences": None,
-            "3-4 sentences": None,
-            "All Social Platforms": None,
-            "Twitter/X": 280,
-            "Instagram": 2200,
-            "LinkedIn": 3000,
-            "Facebook": None
-        }
+        self.platform_limits = PLATFORM_LIMITS
     
     def create_platform_selector(self) -> Tuple[str, int]:
         """Create platform selector with character limits."""
-        platform_options = list(self.platform_limits.keys())
         default_index = 0
         
         selected_platform = st.selectbox(
             "Select Platform:",
-            platform_options,
+            PLATFORM_OPTIONS,
             index=default_index,
             help="Choose a platform to automatically apply character limits",
             key="platform_selector"
@@ -57,15 +71,10 @@ class UIComponents:
         char_count = len(text)
         
         if char_limit:
-            if char_count > char_limit:
-                color = "#ff4444"  # Red for over limit
-                status = f"{char_count}/{char_limit} (over limit)"
-            elif char_count > char_limit * 0.9:
-                color = "#ff8800"  # Orange for warning
-                status = f"{char_count}/{char_limit} (near limit)"
-            else:
-                color = "#00aa00"  # Green for good
-                status = f"{char_count}/{char_limit}"
+            # Booleans sum to the severity index without an if/elif chain
+            severity = (char_count > char_limit * 0.9) + (char_count > char_limit)
+            color = CHAR_COUNT_COLORS[severity]
+            status = f"{char_count}/{char_limit}{CHAR_COUNT_SUFFIXES[severity]}"
         else:
             color = "#666666"
             status = f"{char_count} characters"
@@ -129,9 +138,8 @@ class UIComponents:
             height=100
         ) or ''
         
-        # Update session state - ensure no None values
-        for key, value in business_data.items():
-            st.session_state[key] = value or ''
+        # Update session state in one call - ensure no None values
+        st.session_state.update({key: value or '' for key, value in business_data.items()})
 
         return business_data
 
@@ -190,26 +198,14 @@ class UIComponents:
                         
                         for i, caption in enumerate(captions, 1):
                             with st.container():
-                                st.markdown(f"**Caption {i} for {image_name}:**")
-                                
-                                # Character count display
-                                char_count_html = self.show_character_count(caption, char_limit)
-                                st.markdown(char_count_html, unsafe_allow_html=True)
-                                
-                                # Editable caption area
-                                edited_caption = st.text_area(
+                                self._render_caption_editor(
+                                    f"**Caption {i} for {image_name}:**",
+                                    caption,
+                                    char_limit,
                                     f"Edit Caption {i} for Image {img_idx}",
-                                    value=caption,
-                                    height=100,
-                                    label_visibility="collapsed",
-                                    key=f"caption_edit_img{img_idx}_{i}_{st.session_state.get('session_id', 'default')}"
+                                    f"caption_edit_img{img_idx}_{i}_{st.session_state.get('session_id', 'default')}"
                                 )
                                 
-                                # Show updated character count for edited caption if changed
-                                if edited_caption != caption:
-                                    updated_char_count_html = self.show_character_count(edited_caption, char_limit)
-                                    st.markdown(f"Updated: {updated_char_count_html}", unsafe_allow_html=True)
-                                
                                 if i < len(captions):
                                     st.markdown("---")
             else:
@@ -228,47 +224,55 @@ class UIComponents:
                 
                 for i, caption in enumerate(captions_data, 1):
                     with st.container():
-                        st.markdown(f"**Caption {i}:**")
-                        
-                        # Character count display
-                        char_count_html = self.show_character_count(caption, char_limit)
-                        st.markdown(char_count_html, unsafe_allow_html=True)
-                        
-                        # Editable caption area - users can copy with Ctrl+A, Ctrl+C
-                        edited_caption = st.text_area(
+                        self._render_caption_editor(
+                            f"**Caption {i}:**",
+                            caption,
+                            char_limit,
                             f"Edit Caption {i}",
-                            value=caption,
-                            height=100,
-                            label_visibility="collapsed",
-                            key=f"caption_edit_{i}_{st.session_state.get('session_id', 'default')}"
+                            f"caption_edit_{i}_{st.session_state.get('session_id', 'default')}"
                         )
                         
-                        # Show updated character count for edited caption if changed
-                        if edited_caption != caption:
-                            updated_char_count_html = self.show_character_count(edited_caption, char_limit)
-                            st.markdown(f"Updated: {updated_char_count_html}", unsafe_allow_html=True)
-                        
                         if i < len(captions_data):
                             st.markdown("---")
     
-    def create_ai_model_selector(self) -> str:
-        """Create AI model selection component."""
-        from config.constants import OPENAI_MODELS
+    @st.fragment
+    def _render_caption_editor(self, heading: str, caption: str, char_limit: int, label: str, key: str) -> None:
+        """Render one editable caption with its character count.
         
-        model_options = {
-            "GPT-4o-mini (Recommended)": OPENAI_MODELS["standard"],
-            "GPT-4o (Premium)": OPENAI_MODELS["premium"]
-        }
+        Runs as a fragment so editing a caption only reruns this block instead
+        of the whole page (business form, website analysis, other captions).
+        """
+        st.markdown(heading)
         
+        # Character count display
+        char_count_html = self.show_character_count(caption, char_limit)
+        st.markdown(char_count_html, unsafe_allow_html=True)
+        
+        # Editable caption area - users can copy with Ctrl+A, Ctrl+C
+        edited_caption = st.text_area(
+            label,
+            value=caption,
+            height=100,
+            label_visibility="collapsed",
+            key=key
+        )
+        
+        # Show updated character count for edited caption if changed
+        if edited_caption != caption:
+            updated_char_count_html = self.show_character_count(edited_caption, char_limit)
+            st.markdown(f"Updated: {updated_char_count_html}", unsafe_allow_html=True)
+    
+    def create_ai_model_selector(self) -> str:
+        """Create AI model selection component."""
         selected_model_display = st.selectbox(
             "AI Model",
-            list(model_options.keys()),
+            AI_MODEL_LABELS,
             index=0,  # Default to GPT-4o-mini
             help="GPT-4o-mini is cost-effective for most use cases. GPT-4o provides premium quality.",
-            key=f"ai_model_selector_{uuid.uuid4()}"
+            key="ai_model_selector"
         )
         
-        selected_model = model_options[selected_model_display]
+        selected_model = AI_MODEL_OPTIONS[selected_model_display]
         st.session_state['openai_model'] = selected_model
         
         return selected_model
@@ -279,12 +283,11 @@ class UIComponents:
             "Generate Captions",
             type="primary",
             use_container_width=True,
-            key=f"generate_captions_{uuid.uuid4()}"
+            key="generate_captions_btn"
         )
 
 
+@st.cache_resource
 def get_ui_components():
-    """Get singleton instance of UIComponents."""
-    if 'ui_components' not in st.session_state:
-        st.session_state.ui_components = UIComponents()
-    return st.session_state.ui_components
+    """Get the app-wide UIComponents instance (it holds no per-user state)."""
+    return UIComponents()
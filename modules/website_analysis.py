@@ -5,14 +5,276 @@ Enhanced with GPT-powered business information extraction and 403 error mitigati
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import streamlit as st
 from urllib.parse import urljoin, urlparse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import openai
-import random
-import time
+import re
 import os
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from utils.file_ops import loads_json
+from config.constants import WEBSITE_ANALYSIS_TTL, WEBSITE_MAX_PAGE_BYTES, GPT_EXTRACTION_TTL
+
+try:
+    import lxml  # C parser backend for BeautifulSoup
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Shared connection pool so repeated fetches (redirects, URL variations, later
+# analyses of the same host) reuse open TCP/TLS connections. Connection failures
+# and 429/5xx responses are retried inside urllib3 with backoff (at most 3 requests
+# per fetch); read timeouts are not retried so a slow page costs one timeout. The
+# final response is returned as-is so callers see the real status.
+_HTTP_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    status=2,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET', 'HEAD'}),
+    respect_retry_after_header=False,  # Keep the UI wait bounded by our own backoff
+    raise_on_status=False
+)
+_HTTP_SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_HTTP_RETRY)
+_HTTP_SESSION.mount('https://', _HTTP_ADAPTER)
+_HTTP_SESSION.mount('http://', _HTTP_ADAPTER)
+
+# URL-variation probes run several at once after the main fetch already retried,
+# so they get a single attempt each instead of multiplying connect retries
+_PROBE_SESSION = requests.Session()
+_PROBE_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+_PROBE_SESSION.mount('https://', _PROBE_ADAPTER)
+_PROBE_SESSION.mount('http://', _PROBE_ADAPTER)
+
+# Only build the <head> tags the extractors read plus the whole <body>, so copy
+# sitting directly under <body> or in other tags still reaches the keyword
+# inference; head scripts, styles and link tags are skipped during parsing.
+# The content tags cover fragments and malformed pages with no <body> element.
+_CONTENT_STRAINER = SoupStrainer([
+    'title', 'meta', 'body', 'h1', 'h2', 'h3', 'p',
+    'section', 'div', 'main', 'article', 'header', 'footer'
+])
+
+# Class-name filters for content sections, matched against an element's
+# space-joined class list during the document walks
+_ABOUT_CLASS_RE = re.compile(r'about|company|business|who-we-are', re.I)
+_BUSINESS_CLASS_RE = re.compile(r'about|company|business', re.I)
+_SERVICE_CLASS_RE = re.compile(r'service|product|offering|solution', re.I)
+
+
+def _keyword_pattern(keywords) -> "re.Pattern":
+    """Compile keywords into one alternation so a text is scanned once per category."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+# Keyword tables for basic (non-GPT) inference; checked in order, first hit wins
+_BUSINESS_TYPE_PATTERNS = tuple((label, _keyword_pattern(keywords)) for label, keywords in (
+    ('Restaurant', ['restaurant', 'dining', 'food', 'cuisine', 'menu']),
+    ('Tech Company', ['software', 'technology', 'app', 'digital', 'tech']),
+    ('Retail Store', ['shop', 'store', 'retail', 'products', 'merchandise']),
+    ('Service Provider', ['service', 'consulting', 'solution', 'professional']),
+    ('Healthcare', ['health', 'medical', 'doctor', 'clinic', 'hospital']),
+    ('Education', ['education', 'school', 'training', 'course', 'learn'])
+))
+
+_AUDIENCE_PATTERNS = tuple((label, _keyword_pattern(keywords)) for label, keywords in (
+    ('Small business owners', ['small business', 'entrepreneur', 'startup']),
+    ('Professionals', ['professional', 'corporate', 'business executive']),
+    ('Families', ['family', 'parents', 'children', 'kids']),
+    ('Young adults', ['millennial', 'young adult', 'college', 'student']),
+    ('Seniors', ['senior', 'retirement', 'elderly', 'mature'])
+))
+
+_SERVICE_HEADING_PATTERN = _keyword_pattern(['service', 'product', 'solution', 'offering'])
+
+# Amount of visible page text scanned for audience keywords
+_AUDIENCE_SCAN_CHARS = 8000
+
+# Boilerplate stripped from the end of <title> text when deriving a company name
+_TITLE_SUFFIX_RE = re.compile('(?:%s)+$' % '|'.join(re.escape(suffix) for suffix in (
+    ' - Home', ' | Home', ' - Official Website', ' | Official Site',
+    ' - Homepage', ' | Homepage', ' Home Page', ' | Home Page',
+    ' | Official Website', ' - Official Site', ' | Main Page',
+    ' - Main Page', ' | Welcome', ' - Welcome'
+)))
+_TITLE_LOCATION_RE = re.compile('(?:%s)$' % '|'.join(re.escape(descriptor) for descriptor in (
+    ' in Columbus, OH', ' in Columbus, Ohio', ' - Columbus, OH',
+    ' | Columbus, OH', ' Columbus, OH', ' Columbus Ohio'
+)))
+
+# Media/binary responses that can't contain business text; rejected from headers alone
+_NON_PAGE_CONTENT_TYPES = ('image/', 'audio/', 'video/', 'font/', 'application/pdf', 'application/zip')
+
+
+def _parse_html(content) -> BeautifulSoup:
+    """Parse page content once, keeping only the tags used for extraction."""
+    return BeautifulSoup(content, HTML_PARSER, parse_only=_CONTENT_STRAINER)
+
+
+def _page_text_prefix(soup: BeautifulSoup, limit: int) -> str:
+    """Join the page's visible text up to ``limit`` characters without walking the rest."""
+    parts = []
+    size = 0
+    for text in soup.stripped_strings:
+        parts.append(text)
+        size += len(text) + 1
+        if size >= limit:
+            break
+    return ' '.join(parts)[:limit]
+
+
+def _fetch_page(url: str, headers: Dict[str, str], timeout: float,
+                session: requests.Session = _HTTP_SESSION) -> Tuple[str, str]:
+    """GET a page through a shared session and return (text, final_url).
+    
+    The body is streamed and reading stops after WEBSITE_MAX_PAGE_BYTES; the
+    extractors only need the head and the first headings/paragraphs, so huge
+    pages are never fully downloaded or parsed. Raises for HTTP error statuses
+    and, before any body is read, for responses that clearly aren't a web page.
+    """
+    response = session.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+    try:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type.startswith(_NON_PAGE_CONTENT_TYPES):
+            raise requests.RequestException(f"Unsupported content type: {content_type}")
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=8192):
+            buffer.extend(chunk)
+            if len(buffer) >= WEBSITE_MAX_PAGE_BYTES:
+                break
+    finally:
+        # A body read to the end has already released its connection to the pool.
+        # Closing a capped or rejected body early discards the connection instead,
+        # which is cheaper than draining bytes the cap exists to skip.
+        response.close()
+    
+    body = bytes(buffer[:WEBSITE_MAX_PAGE_BYTES])
+    try:
+        text = body.decode(response.encoding or 'utf-8', errors='replace')
+    except LookupError:
+        text = body.decode('utf-8', errors='replace')
+    return text, response.url
+
+
+def _is_client_error(error: Optional[requests.RequestException]) -> bool:
+    """Whether a fetch failed with a final 4xx response (e.g. a 403 from bot protection)."""
+    response = getattr(error, 'response', None)
+    return response is not None and 400 <= response.status_code < 500
+
+
+# Request headers are fixed per environment, so build them once
+_CLOUD_HEADERS = {
+    # Use simpler, more generic headers in cloud to avoid detection
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+_LOCAL_HEADERS = {
+    # Use the same proven User-Agent as diagnostic script for localhost
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0'
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_cloud_environment_once() -> Tuple[bool, Dict[str, Any]]:
+    """Probe env vars, hostname and memory once per process.
+    
+    Returns:
+        Tuple of (is_cloud, debug_info)
+    """
+    cloud_indicators = [
+        'STREAMLIT_SHARING_MODE',
+        'STREAMLIT_CLOUD', 
+        'HEROKUAPP',
+        'DYNO',
+        'GITHUB_ACTIONS',
+        'RAILWAY_ENVIRONMENT',
+        'RENDER'
+    ]
+    
+    # Check environment variables
+    env_cloud = any(os.getenv(indicator) for indicator in cloud_indicators)
+    
+    # Check if running on common cloud domains
+    hostname = 'Unknown'
+    try:
+        import socket
+        hostname = socket.gethostname()
+        hostname_cloud = any(domain in hostname.lower() for domain in [
+            'streamlit', 'heroku', 'railway', 'render', 'vercel'
+        ])
+    except:
+        hostname_cloud = False
+    
+    # Check for limited resources (common in cloud)
+    try:
+        import psutil
+        memory_gb = psutil.virtual_memory().total / (1024**3)
+        limited_resources = memory_gb < 2  # Less than 2GB suggests cloud
+    except ImportError:
+        # psutil not available, skip memory check
+        limited_resources = False
+        memory_gb = None
+    except Exception:
+        # Any other error with psutil, skip memory check
+        limited_resources = False
+        memory_gb = None
+    
+    is_cloud = env_cloud or hostname_cloud or limited_resources
+    
+    debug_info = {
+        "is_cloud": is_cloud,
+        "env_indicators": [k for k in cloud_indicators if os.getenv(k)],
+        "hostname": hostname,
+        "memory_gb": f"{memory_gb:.1f}" if memory_gb is not None else 'Unknown'
+    }
+    return is_cloud, debug_info
+
+
+class _UncachedAnalysis(Exception):
+    """Carries a failed analysis result out of the cache so it isn't stored."""
+
+
+@st.cache_data(ttl=WEBSITE_ANALYSIS_TTL, show_spinner=False)
+def _cached_website_analysis(url: str, use_gpt: bool, _analyzer: "WebsiteAnalyzer") -> Dict[str, Any]:
+    """Run a website analysis once per (url, use_gpt) across all sessions.
+    
+    The analyzer is excluded from the cache key (leading underscore); only
+    successful results are cached so transient fetch errors can be retried.
+    """
+    results = _analyzer._run_analysis(url)
+    if not results.get('success'):
+        raise _UncachedAnalysis(results)
+    return results
+
+
+@st.cache_data(ttl=GPT_EXTRACTION_TTL, show_spinner=False)
+def _cached_gpt_extraction(content_hash: str, url: str, _analyzer: "WebsiteAnalyzer", _content: str) -> Dict[str, str]:
+    """Run the GPT extraction once per (page content hash, url).
+    
+    The content itself is keyed through its hash rather than hashed by
+    Streamlit; failures raise and are therefore never cached.
+    """
+    return _analyzer._request_gpt_extraction(_content, url)
+
 
 class WebsiteAnalyzer:
     """Analyzes websites to extract business information using web scraping and GPT."""
@@ -32,124 +294,87 @@ class WebsiteAnalyzer:
     
     def _detect_cloud_environment(self):
         """Detect if running in a cloud environment like Streamlit Cloud."""
-        cloud_indicators = [
-            'STREAMLIT_SHARING_MODE',
-            'STREAMLIT_CLOUD', 
-            'HEROKUAPP',
-            'DYNO',
-            'GITHUB_ACTIONS',
-            'RAILWAY_ENVIRONMENT',
-            'RENDER'
-        ]
-        
-        # Check environment variables
-        env_cloud = any(os.getenv(indicator) for indicator in cloud_indicators)
-        
-        # Check if running on common cloud domains
-        try:
-            import socket
-            hostname = socket.gethostname()
-            hostname_cloud = any(domain in hostname.lower() for domain in [
-                'streamlit', 'heroku', 'railway', 'render', 'vercel'
-            ])
-        except:
-            hostname_cloud = False
-        
-        # Check for limited resources (common in cloud)
-        try:
-            import psutil
-            memory_gb = psutil.virtual_memory().total / (1024**3)
-            limited_resources = memory_gb < 2  # Less than 2GB suggests cloud
-        except ImportError:
-            # psutil not available, skip memory check
-            limited_resources = False
-            memory_gb = None
-        except Exception:
-            # Any other error with psutil, skip memory check
-            limited_resources = False
-            memory_gb = None
-        
-        is_cloud = env_cloud or hostname_cloud or limited_resources
+        is_cloud, debug_info = _detect_cloud_environment_once()
         
         # Debug info
         if hasattr(st, 'sidebar'):
             if st.sidebar.checkbox("Show Environment Debug", value=False):
-                st.sidebar.json({
-                    "is_cloud": is_cloud,
-                    "env_indicators": [k for k in cloud_indicators if os.getenv(k)],
-                    "hostname": hostname if 'hostname' in locals() else 'Unknown',
-                    "memory_gb": f"{memory_gb:.1f}" if 'memory_gb' in locals() else 'Unknown'
-                })
+                st.sidebar.json(debug_info)
         
         return is_cloud
     
     def _get_headers(self):
-        """Get randomized headers to avoid bot detection."""
-        if self.is_cloud:
-            # Use simpler, more generic headers in cloud to avoid detection
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
-        else:
-            # Use the same proven User-Agent as diagnostic script for localhost
-            user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            headers = {
-                'User-Agent': user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Cache-Control': 'max-age=0'
-            }
-        
-        # Log the User-Agent being used for debugging
-        return headers
+        """Get request headers suited to the current environment."""
+        return _CLOUD_HEADERS if self.is_cloud else _LOCAL_HEADERS
     
     def analyze_website(self, url: str) -> Dict[str, Any]:
+        """Analyze a website, reusing a recent result for the same URL if available."""
+        url = url.strip()
+        if not url.lower().startswith(('http://', 'https://')):
+            url = 'https://' + url
+        
+        # Normalize so trivially different spellings of a URL share one cache entry
+        parsed = urlparse(url)
+        url = parsed._replace(
+            scheme=parsed.scheme.lower(),
+            netloc=parsed.netloc.lower(),
+            fragment=''
+        ).geturl()
+        
+        try:
+            return _cached_website_analysis(url, bool(self.openai_client), self)
+        except _UncachedAnalysis as uncached:
+            return uncached.args[0]
+    
+    def _run_analysis(self, url: str) -> Dict[str, Any]:
         """Analyze a website with multiple fallback strategies for 403 errors."""
         try:
             # Ensure URL has protocol
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
             
-            # Cloud-specific optimization: try quick basic extraction first
-            if self.is_cloud:
-                try:
-                    content, final_url = self._fetch_with_headers_minimal(url)
-                    if content:
-                        soup = BeautifulSoup(content, 'html.parser')
-                        business_info = self._extract_business_info_basic(soup, final_url)
-                        
-                        return {
-                            'success': True,
-                            'url': final_url,
-                            'business_info': business_info
-                        }
-                except Exception:
-                    pass  # Continue with regular flow if quick method fails
-            
             # Try multiple strategies to bypass 403 errors
             content = None
             final_url = url
+            fetch_error = None
             
-            # Use simple approach
-            try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-                response.raise_for_status()
-                content = response.text
-                final_url = response.url
+            if self.is_cloud:
+                # Cloud-specific optimization: try quick basic extraction first
+                try:
+                    content, final_url = self._fetch_with_headers_minimal(url)
+                except requests.RequestException as e:
+                    content = None  # No same-URL refetch; the adapter already retried
+                    fetch_error = e
                 
-            except Exception:
-                content = None
+                if content:
+                    soup = _parse_html(content)
+                    business_info = self._extract_business_info_basic(soup, final_url)
+                    
+                    return {
+                        'success': True,
+                        'url': final_url,
+                        'business_info': business_info
+                    }
+            else:
+                # Use simple approach
+                try:
+                    headers = {
+                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                    }
+                    content, final_url = _fetch_page(url, headers, timeout=15)
+                    
+                except requests.RequestException as e:
+                    content = None
+                    fetch_error = e
+            
+            # Fall back to www/non-www, scheme and domain-root variations only when
+            # the final response was a 4xx; connection failures, timeouts and 5xx
+            # have already been retried by the adapter
+            if not content and _is_client_error(fetch_error):
+                try:
+                    content, final_url = self._try_url_variations(url)
+                except requests.RequestException:
+                    content = None
             
             if not content:
                 return {
@@ -158,7 +383,7 @@ class WebsiteAnalyzer:
                 }
             
             # Parse content with BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = _parse_html(content)
             
             # Extract business information based on available method
             if self.openai_client:
@@ -247,108 +472,113 @@ class WebsiteAnalyzer:
                 'error': f"Analysis failed: {str(e)}"
             }
     
-    def _fetch_with_headers(self, url: str) -> tuple:
-        """Fetch website content with randomized headers."""
-        headers = self._get_headers()
-        # Adjust timeout based on environment - increased for large websites
-        timeout = 12 if self.is_cloud else 15
-        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-        response.raise_for_status()
-        # Return decoded text instead of raw bytes
-        return response.text, response.url
-    
     def _fetch_with_headers_minimal(self, url: str) -> tuple:
         """Minimal fetch for cloud environments with extended timeout for large sites."""
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=8, allow_redirects=True)
-        response.raise_for_status()
-        # Return decoded text instead of raw bytes
-        return response.text, response.url
-    
-    def _fetch_with_session(self, url: str) -> tuple:
-        """Fetch website content using session with delay."""
-        session = requests.Session()
-        session.headers.update(self._get_headers())
-        
-        # Adjust delay based on environment
-        if self.is_cloud:
-            time.sleep(random.uniform(0.2, 0.8))  # Shorter delay for cloud
-        else:
-            time.sleep(random.uniform(0.5, 1.5))
-        
-        # Adjust timeout based on environment - increased for large websites
-        timeout = 10 if self.is_cloud else 12
-        response = session.get(url, timeout=timeout, allow_redirects=True)
-        response.raise_for_status()
-        # Return decoded text instead of raw bytes
-        return response.text, response.url
+        return _fetch_page(url, headers, timeout=8)
     
     def _try_url_variations(self, url: str) -> tuple:
-        """Try different URL variations to bypass restrictions."""
+        """Try www/non-www and scheme variations of a URL concurrently, then the domain root.
+        
+        Variations that keep the path are fetched in parallel and the earliest one
+        in list order that succeeds wins, so a faster but less specific variation
+        never shadows the requested page. The domain root is only tried once all
+        of them have failed. Returns (text, final_url).
+        """
         parsed = urlparse(url)
+        bare_netloc = parsed.netloc.removeprefix('www.')
         
-        # Try different URL variations
+        # Try different URL variations that keep the requested path
         variations = [
-            f"{parsed.scheme}://www.{parsed.netloc}{parsed.path}",  # Add www
-            f"{parsed.scheme}://{parsed.netloc.replace('www.', '')}{parsed.path}",  # Remove www
+            f"{parsed.scheme}://www.{bare_netloc}{parsed.path}",  # Add www
+            f"{parsed.scheme}://{bare_netloc}{parsed.path}",  # Remove www
             f"https://{parsed.netloc}{parsed.path}",  # Force HTTPS
             f"http://{parsed.netloc}{parsed.path}",   # Try HTTP
         ]
         
-        # Remove duplicates and original URL
-        variations = list(set(variations))
-        if url in variations:
-            variations.remove(url)
+        # Remove duplicates (keeping order) and the URL that already failed
+        variations = [variation for variation in dict.fromkeys(variations) if variation != url]
         
-        for variation in variations:
+        if variations:
+            executor = ThreadPoolExecutor(max_workers=len(variations))
             try:
-                headers = self._get_headers()
-                time.sleep(random.uniform(0.5, 2))  # Random delay
-                
-                response = requests.get(variation, headers=headers, timeout=15, allow_redirects=True)
-                if response.status_code == 200:
-                    # Return decoded text instead of raw bytes
-                    return response.text, response.url
-            except:
-                continue
-        
-        # If all variations fail, try to get basic info from domain
-        try:
-            domain_url = f"{parsed.scheme}://{parsed.netloc}"
-            headers = self._get_headers()
-            response = requests.get(domain_url, headers=headers, timeout=15, allow_redirects=True)
-            if response.status_code == 200:
-                # Return decoded text instead of raw bytes
-                return response.text, response.url
-        except:
-            pass
+                futures = [executor.submit(self._fetch_if_ok, variation) for variation in variations]
+                # Fetches run concurrently, but results are taken in list order
+                for future in futures:
+                    result = future.result()
+                    if result:
+                        return result
+            finally:
+                # Don't wait for later variations once we have an answer
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Last resort: the domain root
+        root_url = f"{parsed.scheme}://{parsed.netloc}"
+        if root_url != url:
+            result = self._fetch_if_ok(root_url)
+            if result:
+                return result
         
         raise requests.exceptions.RequestException("All URL variations failed")
     
+    def _fetch_if_ok(self, url: str) -> Optional[tuple]:
+        """Fetch a URL variation, returning (text, final_url) on success or None."""
+        try:
+            # Short timeout: these are fallback probes after the main fetch failed
+            return _fetch_page(url, self._get_headers(), timeout=8, session=_PROBE_SESSION)
+        except requests.RequestException:
+            return None
+    
     def _extract_raw_content(self, soup: BeautifulSoup) -> str:
         """Extract relevant text content from website for GPT analysis."""
         content_parts = []
         
         self._log_debug("🔍 Starting raw content extraction")
         
+        # Collect everything in a single document walk instead of one search per part
+        title = meta_desc = about_section = None
+        headings = []
+        paragraphs = []
+        for element in soup.descendants:
+            name = element.name
+            if name is None:
+                continue  # Text node
+            if name == 'title':
+                if title is None:
+                    title = element
+            elif name == 'meta':
+                if meta_desc is None and element.get('name') == 'description':
+                    meta_desc = element
+            elif name in ('h1', 'h2', 'h3'):
+                if len(headings) < 5:
+                    headings.append(element)
+            elif name == 'p':
+                if len(paragraphs) < 8:
+                    paragraphs.append(element)
+            elif name in ('section', 'div'):
+                if about_section is None:
+                    classes = ' '.join(element.get('class') or ())
+                    if classes and _ABOUT_CLASS_RE.search(classes):
+                        about_section = element
+            if (title is not None and meta_desc is not None and about_section is not None
+                    and len(headings) == 5 and len(paragraphs) == 8):
+                break
+        
         # Get title
-        title = soup.find('title')
         if title:
             title_text = title.get_text().strip()
             content_parts.append(f"Title: {title_text}")
             self._log_debug(f"📝 Found title: {title_text[:50]}...")
         
         # Get meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
         if meta_desc and meta_desc.get('content'):
             desc_text = meta_desc['content'].strip()
             content_parts.append(f"Description: {desc_text}")
             self._log_debug(f"📝 Found meta description: {desc_text[:50]}...")
         
         # Get main headings
-        headings = soup.find_all(['h1', 'h2', 'h3'], limit=5)
         self._log_debug(f"📝 Found {len(headings)} headings")
         for h in headings:
             heading_text = h.get_text().strip()
@@ -357,7 +587,6 @@ class WebsiteAnalyzer:
                 self._log_debug(f"📝 Heading: {heading_text[:30]}...")
         
         # Get first few paragraphs
-        paragraphs = soup.find_all('p', limit=8)
         meaningful_paragraphs = 0
         self._log_debug(f"📝 Found {len(paragraphs)} paragraphs")
         for p in paragraphs:
@@ -370,9 +599,6 @@ class WebsiteAnalyzer:
         self._log_debug(f"📝 Kept {meaningful_paragraphs} meaningful paragraphs")
         
         # Get about section if exists
-        about_section = soup.find(['section', 'div'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['about', 'company', 'business', 'who-we-are']
-        ))
         if about_section:
             about_text = about_section.get_text()[:500]
             content_parts.append(f"About Section: {about_text}")
@@ -386,7 +612,16 @@ class WebsiteAnalyzer:
     def _extract_with_gpt(self, content: str, url: str) -> Dict[str, str]:
         """Use GPT to extract structured business information from website content."""
         try:
-            prompt = f"""Analyze this website content and extract the following business information in JSON format:
+            # Only the first 2000 characters go into the prompt, so they fully identify it
+            content_hash = hashlib.blake2b(content[:2000].encode('utf-8'), digest_size=16).hexdigest()
+            return _cached_gpt_extraction(content_hash, url, self, content)
+        except Exception:
+            # Fallback to basic extraction
+            return self._extract_business_info_basic_from_content(content)
+    
+    def _request_gpt_extraction(self, content: str, url: str) -> Dict[str, str]:
+        """Call GPT for business information; raises if the request or JSON parsing fails."""
+        prompt = f"""Analyze this website content and extract the following business information in JSON format:
 
 Website URL: {url}
 Website Content:
@@ -410,60 +645,120 @@ Example format:
     "description": "Full-service digital marketing agency helping SMBs grow online"
 }}"""
 
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a business analyst expert at extracting company information from website content. Always return valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=500,
-                temperature=0.3,
-                timeout=15  # Extended timeout for large websites
-            )
-            
-            # Parse JSON response
-            import json
-            gpt_response = response.choices[0].message.content.strip()
-            
-            # Clean response if it has markdown formatting
-            if gpt_response.startswith('```json'):
-                gpt_response = gpt_response.replace('```json', '').replace('```', '').strip()
-            
-            business_info = json.loads(gpt_response)
-            
-            # Validate required fields exist
-            required_fields = ['company_name', 'business_type', 'target_audience', 'product_service', 'description']
-            for field in required_fields:
-                if field not in business_info:
-                    business_info[field] = ""
-            
-            return business_info
-            
-        except Exception as e:
-            # Fallback to basic extraction
-            return self._extract_business_info_basic_from_content(content)
+        response = self.openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You are a business analyst expert at extracting company information from website content. Always return valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=500,
+            temperature=0.3,
+            timeout=15  # Extended timeout for large websites
+        )
+        
+        # Parse JSON response
+        gpt_response = response.choices[0].message.content.strip()
+        
+        # Clean response if it has markdown formatting
+        if gpt_response.startswith('```'):
+            gpt_response = gpt_response.removeprefix('```json').removeprefix('```').removesuffix('```').strip()
+        
+        business_info = loads_json(gpt_response)
+        
+        # Validate required fields exist
+        required_fields = ['company_name', 'business_type', 'target_audience', 'product_service', 'description']
+        for field in required_fields:
+            if field not in business_info:
+                business_info[field] = ""
+        
+        return business_info
     
     def _extract_business_info_basic(self, soup: BeautifulSoup, url: str) -> Dict[str, str]:
         """Basic extraction without GPT (fallback method)."""
         info = {}
         
+        # Lower-case a bounded prefix of the page text once for the keyword-based inference helpers
+        page_text_lower = _page_text_prefix(soup, _AUDIENCE_SCAN_CHARS).lower()
+        
+        # Gather every element the helpers below need in one document walk
+        features = self._collect_dom_features(soup)
+        
         # Extract company name
-        info['company_name'] = self._extract_company_name(soup)
+        info['company_name'] = self._extract_company_name(features)
         
         # Extract business type/description
-        info['business_type'] = self._extract_business_type(soup)
+        info['business_type'] = self._extract_business_type(features)
         
         # Extract description
-        info['description'] = self._extract_description(soup)
+        info['description'] = self._extract_description(features)
         
         # Extract target audience (basic inference)
-        info['target_audience'] = self._infer_target_audience(soup)
+        info['target_audience'] = self._infer_target_audience(page_text_lower)
         
         # Extract product/service
-        info['product_service'] = self._extract_product_service(soup)
+        info['product_service'] = self._extract_product_service(features)
         
         return info
     
+    def _collect_dom_features(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Find the first of each element used by basic extraction in a single walk.
+        
+        Matches what separate find()/find_all() calls would return: the first
+        title, h1, first paragraph, meta description/og tags, business and
+        service sections, and up to three h2/h3 subheadings, in document order.
+        """
+        features = {
+            'title': None, 'h1': None, 'first_p': None,
+            'meta_description': None, 'og_site_name': None, 'og_description': None,
+            'business_section': None, 'service_section': None,
+        }
+        subheadings = []
+        remaining = len(features)
+        
+        for element in soup.descendants:
+            name = element.name
+            if name is None:
+                continue  # Text node
+            
+            if name == 'meta':
+                if features['meta_description'] is None and element.get('name') == 'description':
+                    features['meta_description'] = element
+                    remaining -= 1
+                else:
+                    prop = element.get('property')
+                    if prop == 'og:site_name' and features['og_site_name'] is None:
+                        features['og_site_name'] = element
+                        remaining -= 1
+                    elif prop == 'og:description' and features['og_description'] is None:
+                        features['og_description'] = element
+                        remaining -= 1
+            elif name in ('section', 'div'):
+                classes = ' '.join(element.get('class') or ())
+                if classes:
+                    if features['business_section'] is None and _BUSINESS_CLASS_RE.search(classes):
+                        features['business_section'] = element
+                        remaining -= 1
+                    if features['service_section'] is None and _SERVICE_CLASS_RE.search(classes):
+                        features['service_section'] = element
+                        remaining -= 1
+            elif name in ('h2', 'h3'):
+                if len(subheadings) < 3:
+                    subheadings.append(element)
+            elif name == 'p':
+                if features['first_p'] is None:
+                    features['first_p'] = element
+                    remaining -= 1
+            elif name in ('title', 'h1'):
+                if features[name] is None:
+                    features[name] = element
+                    remaining -= 1
+            
+            if remaining == 0 and len(subheadings) == 3:
+                break
+        
+        features['subheadings'] = subheadings
+        return features
+    
     def _extract_business_info_basic_from_content(self, content: str) -> Dict[str, str]:
         """Extract basic info from raw content (GPT fallback)."""
         lines = content.split('\n')
@@ -480,9 +775,7 @@ Example format:
             if line.startswith('Title:'):
                 title = line.replace('Title:', '').strip()
                 # Clean common suffixes
-                for suffix in [' - Home', ' | Home', ' - Official Website']:
-                    if title.endswith(suffix):
-                        title = title[:-len(suffix)]
+                title = _TITLE_SUFFIX_RE.sub('', title)
                 info['company_name'] = title
                 break
         
@@ -494,34 +787,18 @@ Example format:
         
         return info
     
-    def _extract_company_name(self, soup: BeautifulSoup) -> str:
+    def _extract_company_name(self, features: Dict[str, Any]) -> str:
         """Extract company name from website."""
         # Try title tag first
-        title = soup.find('title')
+        title = features['title']
         if title:
             title_text = title.get_text().strip()
             
             # Remove common suffixes and prefixes
-            suffixes_to_remove = [
-                ' - Home', ' | Home', ' - Official Website', ' | Official Site',
-                ' - Homepage', ' | Homepage', ' Home Page', ' | Home Page',
-                ' | Official Website', ' - Official Site', ' | Main Page',
-                ' - Main Page', ' | Welcome', ' - Welcome'
-            ]
-            
-            for suffix in suffixes_to_remove:
-                if title_text.endswith(suffix):
-                    title_text = title_text[:-len(suffix)]
+            title_text = _TITLE_SUFFIX_RE.sub('', title_text)
             
             # Clean up common business descriptors at the end
-            descriptors_to_remove = [
-                ' in Columbus, OH', ' in Columbus, Ohio', ' - Columbus, OH',
-                ' | Columbus, OH', ' Columbus, OH', ' Columbus Ohio'
-            ]
-            
-            for descriptor in descriptors_to_remove:
-                if title_text.endswith(descriptor):
-                    title_text = title_text[:-len(descriptor)]
+            title_text = _TITLE_LOCATION_RE.sub('', title_text)
             
             # Extract just the company name if it contains descriptive text
             # Look for patterns like "Company Name | Description" or "Company Name - Description"
@@ -535,97 +812,73 @@ Example format:
                 return title_text.strip()
         
         # Try h1 tag
-        h1 = soup.find('h1')
+        h1 = features['h1']
         if h1:
             return h1.get_text().strip()
         
         # Try meta property og:site_name
-        og_site = soup.find('meta', property='og:site_name')
+        og_site = features['og_site_name']
         if og_site and og_site.get('content'):
             return og_site['content'].strip()
         
         return ""
     
-    def _extract_business_type(self, soup: BeautifulSoup) -> str:
+    def _extract_business_type(self, features: Dict[str, Any]) -> str:
         """Extract business type from website."""
         # Look for about section
-        about_section = soup.find(['section', 'div'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['about', 'company', 'business']
-        ))
+        about_section = features['business_section']
         
         if about_section:
             text = about_section.get_text()[:200]
             # Simple business type inference
-            business_types = {
-                'Restaurant': ['restaurant', 'dining', 'food', 'cuisine', 'menu'],
-                'Tech Company': ['software', 'technology', 'app', 'digital', 'tech'],
-                'Retail Store': ['shop', 'store', 'retail', 'products', 'merchandise'],
-                'Service Provider': ['service', 'consulting', 'solution', 'professional'],
-                'Healthcare': ['health', 'medical', 'doctor', 'clinic', 'hospital'],
-                'Education': ['education', 'school', 'training', 'course', 'learn']
-            }
-            
             text_lower = text.lower()
-            for biz_type, keywords in business_types.items():
-                if any(keyword in text_lower for keyword in keywords):
+            for biz_type, pattern in _BUSINESS_TYPE_PATTERNS:
+                if pattern.search(text_lower):
                     return biz_type
         
         return ""
     
-    def _extract_description(self, soup: BeautifulSoup) -> str:
+    def _extract_description(self, features: Dict[str, Any]) -> str:
         """Extract business description from website."""
         # Try meta description first
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc = features['meta_description']
         if meta_desc and meta_desc.get('content'):
             return meta_desc['content'].strip()
         
         # Try og:description
-        og_desc = soup.find('meta', property='og:description')
+        og_desc = features['og_description']
         if og_desc and og_desc.get('content'):
             return og_desc['content'].strip()
         
         # Try first paragraph
-        first_p = soup.find('p')
+        first_p = features['first_p']
         if first_p:
             return first_p.get_text().strip()[:200]
         
         return ""
     
-    def _infer_target_audience(self, soup: BeautifulSoup) -> str:
-        """Infer target audience from website content."""
-        text_content = soup.get_text().lower()
-        
+    def _infer_target_audience(self, text_lower: str) -> str:
+        """Infer target audience from already lower-cased website text."""
         # Simple audience inference based on keywords
-        audiences = {
-            'Small business owners': ['small business', 'entrepreneur', 'startup'],
-            'Professionals': ['professional', 'corporate', 'business executive'],
-            'Families': ['family', 'parents', 'children', 'kids'],
-            'Young adults': ['millennial', 'young adult', 'college', 'student'],
-            'Seniors': ['senior', 'retirement', 'elderly', 'mature']
-        }
-        
-        for audience, keywords in audiences.items():
-            if any(keyword in text_content for keyword in keywords):
+        for audience, pattern in _AUDIENCE_PATTERNS:
+            if pattern.search(text_lower):
                 return audience
         
         return "General audience"
     
-    def _extract_product_service(self, soup: BeautifulSoup) -> str:
+    def _extract_product_service(self, features: Dict[str, Any]) -> str:
         """Extract main product or service offering."""
         # Look for services/products sections
-        service_section = soup.find(['section', 'div'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['service', 'product', 'offering', 'solution']
-        ))
+        service_section = features['service_section']
         
         if service_section:
             text = service_section.get_text().strip()[:150]
             return text
         
         # Try to find from headings
-        headings = soup.find_all(['h2', 'h3'], limit=3)
-        for h in headings:
+        for h in features['subheadings']:
             text = h.get_text().strip()
-            if any(word in text.lower() for word in ['service', 'product', 'solution', 'offering']):
+            if _SERVICE_HEADING_PATTERN.search(text.lower()):
                 return text
         
         return ""
@@ -0,0 +1,38 @@
+"""Regression tests for the basic (non-GPT) website extraction."""
+import pytest
+
+pytest.importorskip('bs4')
+pytest.importorskip('requests')
+pytest.importorskip('streamlit')
+pytest.importorskip('openai')
+
+from modules.website_analysis import WebsiteAnalyzer, _parse_html
+
+
+PAGE_WITH_LOOSE_COPY = """<!DOCTYPE html>
+<html>
+<head><title>Acme Bookkeeping</title></head>
+<body>
+Bookkeeping and payroll for every small business in town.
+<ul><li><span>Built for entrepreneurs who would rather not do the books.</span></li></ul>
+</body>
+</html>"""
+
+
+def _basic_info(html):
+    # Basic extraction uses no instance state, so skip the Streamlit-bound constructor
+    analyzer = WebsiteAnalyzer.__new__(WebsiteAnalyzer)
+    return analyzer._extract_business_info_basic(_parse_html(html), 'https://acme.example')
+
+
+def test_audience_inferred_from_copy_outside_content_tags():
+    info = _basic_info(PAGE_WITH_LOOSE_COPY)
+
+    assert info['target_audience'] == 'Small business owners'
+
+
+def test_loose_body_text_survives_parsing():
+    text = ' '.join(_parse_html(PAGE_WITH_LOOSE_COPY).stripped_strings)
+
+    assert 'Bookkeeping and payroll' in text
+    assert 'Built for entrepreneurs' in text
@@ -5,9 +5,85 @@ File operations utilities for JSON data management.
 
 import json
 import os
-from typing import Dict, List, Any, Optional
+import tempfile
+from typing import Dict, List, Any, Optional, Union
 import streamlit as st
 
+# Faster C-based JSON encoder/decoder with stdlib fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Decoder chosen once at import; json.loads reuses the stdlib's shared default decoder
+_decode_json = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _current_umask() -> int:
+    """Return the process umask (os.umask can only be read by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+# Mode open() would give a new file; read once at import, before any worker threads
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def loads_json(raw: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or text.
+    
+    Args:
+        raw: Encoded JSON document or JSON string
+        
+    Returns:
+        Decoded data
+    """
+    return _decode_json(raw)
+
+def write_bytes_atomic(filepath: str, payload: bytes) -> None:
+    """Write bytes to a file atomically via a unique temporary file and rename.
+    
+    Readers never observe a partially written file, and concurrent writers to
+    the same path each use their own temporary file, so the last rename wins
+    with a complete payload. No fsync is issued since these files are not
+    durability-critical.
+    
+    Args:
+        filepath: Destination path
+        payload: Bytes to write
+    """
+    directory = os.path.dirname(filepath) or "."
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=os.path.basename(filepath) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        # mkstemp creates the file 0600; keep the destination's mode, or open()'s default for a new file
+        try:
+            os.chmod(tmp_path, os.stat(filepath).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, _NEW_FILE_MODE)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def load_json_file(filepath: str) -> Dict[str, Any]:
     """Load data from a JSON file with error handling.
     
@@ -19,8 +95,8 @@ def load_json_file(filepath: str) -> Dict[str, Any]:
     """
     try:
         if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                return loads_json(f.read())
         return {}
     except (json.JSONDecodeError, FileNotFoundError):
         return {}
@@ -39,8 +115,7 @@ def save_json_file(filepath: str, data: Any) -> bool:
         True if successful, False otherwise
     """
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_bytes_atomic(filepath, dumps_json(data))
         return True
     except (PermissionError, OSError) as e:
         st.error(f"File access error saving {filepath}: {str(e)}")
@@ -60,8 +135,8 @@ def load_list_from_json(filepath: str) -> List[Dict[str, Any]]:
     """
     try:
         if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = loads_json(f.read())
                 return data if isinstance(data, list) else []
         return []
     except (json.JSONDecodeError, FileNotFoundError):
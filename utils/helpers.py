@@ -125,10 +125,9 @@ def export_data_to_csv(data: List[Dict[str, Any]], headers: List[str]) -> Option
     # Write headers
     writer.writerow(headers)
     
-    # Write data
-    for item in data:
-        row = [item.get(header.lower().replace(' ', '_'), '') for header in headers]
-        writer.writerow(row)
+    # Write data, deriving each column's dict key once rather than per row
+    keys = [header.lower().replace(' ', '_') for header in headers]
+    writer.writerows([item.get(key, '') for key in keys] for item in data)
     
     return output.getvalue()
 